@@ -14,7 +14,6 @@
 """Pydantic models specific to video workflows."""
 import logging
 import mimetypes
-import os
 import sys
 from typing import Self
 import pydantic
@@ -56,9 +55,6 @@ class GeminiPromptRequest(pydantic.BaseModel):
         logger.info(
             'Attempting to load image data from: %s', self.image_file_path
         )
-        if not os.path.exists(self.image_file_path):
-          raise ValueError(f'Image file not found: {self.image_file_path}')
-
         mime_type_guess, _ = mimetypes.guess_type(self.image_file_path)
         if mime_type_guess is None:
           self.mime_type = 'application/octet-stream'
@@ -68,8 +64,8 @@ class GeminiPromptRequest(pydantic.BaseModel):
               self.mime_type,
           )
         else:
-          logger.info('Determined MIME type: %s', self.mime_type)
           self.mime_type = mime_type_guess
+          logger.info('Determined MIME type: %s', self.mime_type)
 
         with open(self.image_file_path, 'rb') as f:
           self.image_bytes = f.read()
@@ -13,18 +13,22 @@
 # limitations under the License.
 """Exposes core data models for the gen_v package."""
 from gen_v.storage.gcs import download_file_locally
+from gen_v.storage.gcs import get_storage_client
 from gen_v.storage.gcs import download_files
 from gen_v.storage.gcs import retrieve_all_files_from_gcs_folder
 from gen_v.storage.gcs import get_file_name_from_gcs_url
+from gen_v.storage.gcs import split_gcs_url
 from gen_v.storage.gcs import upload_file_to_gcs
 from gen_v.storage.gcs import create_gcs_folders_in_subfolder
 from gen_v.storage.gcs import move_blob
 
 __all__ = [
     'download_file_locally',
+    'get_storage_client',
     'download_files',
     'retrieve_all_files_from_gcs_folder',
     'get_file_name_from_gcs_url',
+    'split_gcs_url',
     'upload_file_to_gcs',
     'create_gcs_folders_in_subfolder',
     'move_blob',
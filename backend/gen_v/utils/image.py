@@ -14,6 +14,7 @@
 """Utilities for image manipulation.
 
 Helper functions for working with images using the Pillow library."""
+import concurrent.futures
 import logging
 import sys
 from PIL import Image
@@ -25,6 +26,9 @@ logging.basicConfig(stream=sys.stdout)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Upper bound on concurrent uploads, to stay clear of GCS rate limits.
+UPLOAD_MAX_WORKERS = 8
+
 
 def rescale_image_height(image_path: str, desired_height: int) -> Image:
   """Rescales an image to a desired height, maintaining the aspect ratio.
@@ -195,8 +199,11 @@ def replace_background_color(
     )
     for x in range(width):
       for y in range(height):
-        current_pixel_rgba = image_data[x, y]
-        current_color = models.RGBColor.from_tuple(current_pixel_rgba[:3])
+        red, green, blue, _ = image_data[x, y]
+        # Pillow pixel values are always in range, so skip validation.
+        current_color = models.RGBColor.model_construct(
+            r=red, g=green, b=blue
+        )
         if current_color.distance_to(target_color) < threshold:
           image_data[x, y] = replacement_rgba
     try:
@@ -231,26 +238,38 @@ def process_and_resize_images(
   images_uris = storage.retrieve_all_files_from_gcs_folder(images_uri)
   logger.info('Found %d images', len(images_uris))
   selected_products = []
-  for img_uri in images_uris:
-    image_file_name = storage.get_file_name_from_gcs_url(img_uri)
-    input_image_local_file_path = storage.download_file_locally(img_uri)
-    img_file_name_no_extension = image_file_name.split('.')[0]
-    resized_image_local_path = (
-        f'{img_file_name_no_extension}-resized-{width}_{height}.png'
-    )
-    place_rescaled_image_on_background(
-        input_image_local_file_path,
-        width,
-        height,
-        color,
-        resized_image_local_path,
-    )
-    resized_image_uri = f'{output_uri}/{resized_image_local_path}'
-    storage.upload_file_to_gcs(resized_image_local_path, resized_image_uri)
-    selected_products.append({
-        'title': image_file_name,
-        'resized_image_uri': resized_image_uri,
-    })
+  # Keyed by local path: inputs sharing a file stem resize to the same file,
+  # which must not be overwritten while its previous upload is in flight.
+  pending_uploads = {}
+  with concurrent.futures.ThreadPoolExecutor(UPLOAD_MAX_WORKERS) as executor:
+    for img_uri in images_uris:
+      image_file_name = storage.get_file_name_from_gcs_url(img_uri)
+      input_image_local_file_path = storage.download_file_locally(img_uri)
+      img_file_name_no_extension = image_file_name.partition('.')[0]
+      resized_image_local_path = (
+          f'{img_file_name_no_extension}-resized-{width}_{height}.png'
+      )
+      if previous_upload := pending_uploads.pop(resized_image_local_path, None):
+        previous_upload.result()
+      place_rescaled_image_on_background(
+          input_image_local_file_path,
+          width,
+          height,
+          color,
+          resized_image_local_path,
+      )
+      resized_image_uri = f'{output_uri}/{resized_image_local_path}'
+      pending_uploads[resized_image_local_path] = executor.submit(
+          storage.upload_file_to_gcs,
+          resized_image_local_path,
+          resized_image_uri,
+      )
+      selected_products.append({
+          'title': image_file_name,
+          'resized_image_uri': resized_image_uri,
+      })
+    for upload in pending_uploads.values():
+      upload.result()
   return selected_products
 
 
@@ -269,22 +288,38 @@ def recolor_background_and_upload(
       target_color: The color to be replaced
       background_color: The background color to be used for the new image.
   """
-  for product in selected_products:
-    resized_image_uri = product['resized_image_uri']
-
-    local_resized_image_path = storage.download_file_locally(resized_image_uri)
-    file_name = storage.get_file_name_from_gcs_url(resized_image_uri)
-    file_name_without_extension, file_extension = file_name.split('.', 1)
-    recolored_image_local_path = (
-        f'{file_name_without_extension}-recolored-'
-        f'{background_color}.{file_extension}'
-    )
-    replace_background_color(
-        local_resized_image_path,
-        target_color,
-        background_color,
-        recolored_image_local_path,
-    )
-    recolored_image_uri = f'gs://{output_uri}/{recolored_image_local_path}'
-    storage.upload_file_to_gcs(recolored_image_local_path, recolored_image_uri)
-    product['recolored_image_uri'] = recolored_image_uri
+  # Keyed by local path so a recolored file is never overwritten while its
+  # previous upload is in flight.
+  pending_uploads = {}
+  with concurrent.futures.ThreadPoolExecutor(UPLOAD_MAX_WORKERS) as executor:
+    for product in selected_products:
+      resized_image_uri = product['resized_image_uri']
+
+      local_resized_image_path = storage.download_file_locally(
+          resized_image_uri
+      )
+      file_name = storage.get_file_name_from_gcs_url(resized_image_uri)
+      file_name_without_extension, file_extension = file_name.split('.', 1)
+      recolored_image_local_path = (
+          f'{file_name_without_extension}-recolored-'
+          f'{background_color}.{file_extension}'
+      )
+      if previous_upload := pending_uploads.pop(
+          recolored_image_local_path, None
+      ):
+        previous_upload.result()
+      replace_background_color(
+          local_resized_image_path,
+          target_color,
+          background_color,
+          recolored_image_local_path,
+      )
+      recolored_image_uri = f'gs://{output_uri}/{recolored_image_local_path}'
+      pending_uploads[recolored_image_local_path] = executor.submit(
+          storage.upload_file_to_gcs,
+          recolored_image_local_path,
+          recolored_image_uri,
+      )
+      product['recolored_image_uri'] = recolored_image_uri
+    for upload in pending_uploads.values():
+      upload.result()
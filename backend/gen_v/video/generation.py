@@ -26,6 +26,7 @@ import time
 
 from google import genai
 import google.auth
+from google.auth import credentials as auth_credentials
 from google.auth.transport import requests as google_requests
 from google.cloud import storage as gcp_storage
 from google.genai import types
@@ -42,9 +43,20 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-def get_access_token() -> str:
-  """Retrieves the access token for the currently active account."""
+@functools.cache
+def get_default_credentials() -> auth_credentials.Credentials:
+  """Returns the application default credentials, loaded once per process."""
   creds, _ = google.auth.default()
+  return creds
+
+
+def get_access_token() -> str:
+  """Retrieves the access token for the currently active account.
+
+  The credentials are shared between calls and only refreshed once the
+  cached token is no longer valid.
+  """
+  creds = get_default_credentials()
   if not creds.valid:
     creds.refresh(google_requests.Request())
   return creds.token
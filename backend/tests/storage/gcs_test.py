@@ -32,7 +32,9 @@ def fixture_mock_blob(fs):
   mock_blob.file = 'original_video.mp4'
   mock_blob.contents = 'The original contents'
 
-  def upload_from_filename(filename: str, client: storage.Client):  # pylint: disable=unused-argument
+  def upload_from_filename(  # pylint: disable=unused-argument
+      filename: str, client: storage.Client, checksum: str
+  ):
     mock_blob.file = filename
     with open(filename, 'r', encoding='UTF-8') as f:
       mock_blob.contents = f.read()
@@ -87,6 +89,33 @@ def fixture_mock_storage():
     yield mock_exists
 
 
+@pytest.mark.parametrize(
+    'gcs_uri, expected',
+    [
+        ('gs://bucket/folder/file.mp4', ('bucket', 'folder/file.mp4')),
+        ('bucket/folder/', ('bucket', 'folder/')),
+        ('gs://bucket', ('bucket', '')),
+    ],
+)
+def test_split_gcs_url(gcs_uri, expected):
+  assert gcs.split_gcs_url(gcs_uri) == expected
+
+
+def test_get_storage_client_is_shared_and_pooled():
+  gcs.get_storage_client.cache_clear()
+  with mock.patch.object(storage, 'Client') as mock_client:
+    first_client = gcs.get_storage_client()
+    second_client = gcs.get_storage_client()
+  gcs.get_storage_client.cache_clear()
+
+  assert first_client is second_client
+  mock_client.assert_called_once_with()
+  session = first_client._http  # pylint: disable=protected-access
+  mount_args = session.mount.call_args.args
+  assert mount_args[0] == 'https://'
+  assert mount_args[1]._pool_maxsize == 200  # pylint: disable=protected-access
+
+
 def test_get_file_name_from_gcs_url():
   test_filename = 'gcs://hello/world/video.mp4'
   expected_file = 'video.mp4'
@@ -106,6 +135,27 @@ def test_upload_file_to_gcs(mock_storage_client, fake_fs):
   assert mock_storage_client.bucket().blob().file == file_path
 
 
+def test_upload_file_to_gcs_large_file_uses_parallel_chunks(
+    mock_storage_client, mock_blob, fake_fs
+):
+  file_path = '/var/data/large_video.mp4'
+  fake_fs.create_file(file_path, st_size=200 * 1024 * 1024)
+
+  with mock.patch(
+      'gen_v.storage.gcs.transfer_manager.upload_chunks_concurrently',
+      autospec=True,
+  ) as mock_upload_chunks:
+    gcs.upload_file_to_gcs(
+        file_path, 'gs://test_bucket/large_video.mp4', mock_storage_client
+    )
+
+  mock_upload_chunks.assert_called_once()
+  args, kwargs = mock_upload_chunks.call_args
+  assert args == (file_path, mock_blob)
+  assert kwargs['chunk_size'] == 32 * 1024 * 1024
+  assert mock_blob.file == 'original_video.mp4'
+
+
 def test_download_file_locally(mock_storage_client):
   file_content = 'The original contents'
   file_path = '/content/test_file.mp4'
@@ -128,22 +178,43 @@ def test_create_gcs_folders_in_subfolder_with_one_folder(
   bucket_name = 'my-test-bucket'
   subfolder_name = 'my-subfolder'
   folder_names = ['new-folder1']
-  mock_blob.exists.return_value = False
+  mock_bucket.list_blobs.return_value.pages = []
+  mock_bucket.list_blobs.return_value.prefixes = set()
 
   gcs.create_gcs_folders_in_subfolder(
       bucket_name, subfolder_name, folder_names, mock_storage_client
   )
 
   mock_storage_client.bucket.assert_called_once_with(bucket_name)
+  mock_bucket.list_blobs.assert_called_once_with(
+      prefix=f'{subfolder_name}/', delimiter='/'
+  )
   mock_bucket.blob.assert_called_once_with(
       f'{subfolder_name}/{folder_names[0]}/'
   )
-  mock_blob.exists.assert_called_once()
   mock_blob.upload_from_string.assert_called_once_with('')
 
   assert 'Folder created: new-folder1' in caplog.text
 
 
+def test_create_gcs_folders_in_subfolder_skips_existing_folders(
+    mock_storage_client, mock_bucket, mock_blob
+):
+  mock_bucket.list_blobs.return_value.pages = []
+  mock_bucket.list_blobs.return_value.prefixes = {'my-subfolder/existing/'}
+
+  gcs.create_gcs_folders_in_subfolder(
+      'my-test-bucket',
+      'my-subfolder',
+      ['existing', 'new-folder'],
+      mock_storage_client,
+  )
+
+  mock_bucket.list_blobs.assert_called_once()
+  mock_bucket.blob.assert_called_once_with('my-subfolder/new-folder/')
+  mock_blob.upload_from_string.assert_called_once_with('')
+
+
 def test_move_blob(mock_storage_client):
 
   source_guri = (
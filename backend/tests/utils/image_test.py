@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit tests for image utils."""
+import functools
+import io
 import os
 from unittest import mock
 from PIL import Image
@@ -20,6 +22,16 @@ from gen_v import models
 from gen_v.utils import image
 
 
+@functools.cache
+def solid_png_bytes(
+    size: tuple[int, int], color: tuple[int, int, int]
+) -> bytes:
+  """Returns a solid colour PNG, encoded once per size and colour."""
+  buffer = io.BytesIO()
+  Image.new('RGB', size, color=color).save(buffer, 'PNG', compress_level=1)
+  return buffer.getvalue()
+
+
 @pytest.fixture(name='sample_image_files')
 def fixture_sample_image_files(tmpdir):
   """Creates sample wide (200x100) and tall (100x200) images.
@@ -31,13 +43,13 @@ def fixture_sample_image_files(tmpdir):
   image_paths = {}
 
   wide_image_path = os.path.join(tmpdir, 'wide_test_image.png')
-  img_wide = Image.new('RGB', (200, 100), color=(0, 255, 0))
-  img_wide.save(wide_image_path)
+  with open(wide_image_path, 'wb') as f:
+    f.write(solid_png_bytes((200, 100), (0, 255, 0)))
   image_paths['wide'] = wide_image_path
 
   tall_image_path = os.path.join(tmpdir, 'tall_test_image.png')
-  img_tall = Image.new('RGB', (100, 200), color=(0, 0, 255))
-  img_tall.save(tall_image_path)
+  with open(tall_image_path, 'wb') as f:
+    f.write(solid_png_bytes((100, 200), (0, 0, 255)))
   image_paths['tall'] = tall_image_path
 
   return image_paths
@@ -231,7 +243,9 @@ def test_process_and_resize_images_simple_flow(
   )
   mock_gcs_storage.download_file_locally.assert_called_once_with(img_uri)
   mock_place.assert_called_once()
-  mock_gcs_storage.upload_file_to_gcs.assert_called_once()
+  mock_gcs_storage.upload_file_to_gcs.assert_called_once_with(
+      local_resized_path, expected_output_uri
+  )
 
 
 @mock.patch('gen_v.utils.image.replace_background_color')
@@ -279,3 +293,37 @@ def test_recolor_background_and_upload_simple_flow(
   )
   mock_replace.assert_called_once()
   mock_gcs_storage.upload_file_to_gcs.assert_called_once()
+
+
+@mock.patch('gen_v.utils.image.place_rescaled_image_on_background')
+def test_process_and_resize_images_waits_for_upload_of_shared_path(
+    mock_place,
+    mock_gcs_storage,
+):
+  """Tests a resized file is not overwritten while it is being uploaded."""
+  input_gcs_uri = 'gs://my-bucket/input-images/'
+  local_resized_path = 'sample-resized-80_60.png'
+  events = []
+  mock_gcs_storage.retrieve_all_files_from_gcs_folder.return_value = [
+      f'{input_gcs_uri}sample.jpg',
+      f'{input_gcs_uri}sample.png',
+  ]
+  mock_place.side_effect = lambda *args: events.append(('resize', args[-1]))
+  mock_gcs_storage.upload_file_to_gcs.side_effect = (
+      lambda path, uri: events.append(('upload', path))
+  )
+
+  image.process_and_resize_images(
+      images_uri=input_gcs_uri,
+      width=80,
+      height=60,
+      color=models.RGBColor(r=255, g=255, b=255),
+      output_uri='gs://my-bucket/resized',
+  )
+
+  assert events == [
+      ('resize', local_resized_path),
+      ('upload', local_resized_path),
+      ('resize', local_resized_path),
+      ('upload', local_resized_path),
+  ]
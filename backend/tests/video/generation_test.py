@@ -131,6 +131,23 @@ def fixture_storage_client(mock_bucket):
   yield mock_storage_client
 
 
+@mock.patch('gen_v.video.generation.google.auth.default')
+def test_get_access_token_reuses_credentials(mock_auth_default):
+  mock_creds = mock.MagicMock()
+  mock_creds.valid = True
+  mock_creds.token = 'my-token-abc'
+  mock_auth_default.return_value = (mock_creds, 'my-project')
+  generation.get_default_credentials.cache_clear()
+
+  first_token = generation.get_access_token()
+  second_token = generation.get_access_token()
+  generation.get_default_credentials.cache_clear()
+
+  assert first_token == second_token == 'my-token-abc'
+  mock_auth_default.assert_called_once()
+  mock_creds.refresh.assert_not_called()
+
+
 def test_send_request_to_google_api(mock_requests_post):
   mock_api_endpoint = 'https://europe-west2-aiplatform.googleapis.com/v1'
   mock_data = {'key': 'value'}